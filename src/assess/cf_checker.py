@@ -290,9 +290,14 @@ def compare_datasets(dataset1_path: str, dataset2_path: str) -> Dict:
     checker1.run_compliance_check()
     summary1 = checker1.get_summary()
 
-    checker2 = CFComplianceChecker(dataset2_path)
-    checker2.run_compliance_check()
-    summary2 = checker2.get_summary()
+    # Same file on both sides: the second checker run would produce the
+    # identical summary, so skip it
+    if Path(dataset1_path).resolve() == Path(dataset2_path).resolve():
+        summary2 = summary1
+    else:
+        checker2 = CFComplianceChecker(dataset2_path)
+        checker2.run_compliance_check()
+        summary2 = checker2.get_summary()
 
     comparison = {
         'dataset1': {
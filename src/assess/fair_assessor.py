@@ -567,22 +567,20 @@ class FAIRAssessor:
 
         return score
 
-    def generate_report(self, score: FAIRScore, output_path: Optional[str] = None) -> str:
+    def build_report_dict(self, score: FAIRScore) -> Dict:
         """
-        Generate detailed assessment report
+        Build the assessment report as a plain dictionary
 
         Parameters:
         -----------
         score : FAIRScore
             Assessment results
-        output_path : str, optional
-            Path to save JSON report
 
         Returns:
         --------
-        str: Path to saved report or JSON string
+        dict: Report structure, ready for JSON serialization
         """
-        report = {
+        return {
             'dataset': str(self.dataset_path),
             'timestamp': str(Path(self.dataset_path).stat().st_mtime),
             'summary': {
@@ -605,6 +603,23 @@ class FAIRAssessor:
             ]
         }
 
+    def generate_report(self, score: FAIRScore, output_path: Optional[str] = None) -> str:
+        """
+        Generate detailed assessment report
+
+        Parameters:
+        -----------
+        score : FAIRScore
+            Assessment results
+        output_path : str, optional
+            Path to save JSON report
+
+        Returns:
+        --------
+        str: Path to saved report or JSON string
+        """
+        report = self.build_report_dict(score)
+
         if output_path:
             with open(output_path, 'w') as f:
                 json.dump(report, f, indent=2)
@@ -23,7 +23,8 @@ class BaseEnricher(ABC):
     Each enricher focuses on improving specific aspects of FAIR compliance.
     """
 
-    def __init__(self, dataset: xr.Dataset, logger=None):
+    def __init__(self, dataset: xr.Dataset, logger=None,
+                 preserve_input: bool = False):
         """
         Initialize enricher
 
@@ -33,9 +34,15 @@ class BaseEnricher(ABC):
             Dataset to enrich
         logger : logging.Logger, optional
             Logger instance
+        preserve_input : bool
+            When True, enrich() works on a copy and leaves the input
+            dataset's attributes untouched. Defaults to False: callers
+            chain enrichers, so the intermediate copies were discarded
+            anyway and enrichment mutates the input in place.
         """
         self.dataset = dataset
         self.logger = logger or get_logger(self.__class__.__name__)
+        self.preserve_input = preserve_input
         self.changes_made = []
         self.issues_found = []
 
@@ -76,7 +83,8 @@ class BaseEnricher(ABC):
             'type': change_type,
             'details': details
         })
-        self.logger.debug(f"[{change_type}] {details}")
+        # %-style so the logger only interpolates when DEBUG is live
+        self.logger.debug("[%s] %s", change_type, details)
 
     def log_issue(self, issue_type: str, details: str):
         """
@@ -93,7 +101,51 @@ class BaseEnricher(ABC):
             'type': issue_type,
             'details': details
         })
-        self.logger.warning(f"[{issue_type}] {details}")
+        self.logger.warning("[%s] %s", issue_type, details)
+
+    def _working_copy(self) -> xr.Dataset:
+        """Return the dataset enrich() should mutate
+
+        Copies only when preserve_input was requested, so the caller's
+        metadata stays intact; the copy itself goes through _safe_copy.
+        """
+        if self.preserve_input:
+            return self._safe_copy(self.dataset)
+        return self.dataset
+
+    @staticmethod
+    def _safe_copy(ds: xr.Dataset) -> xr.Dataset:
+        """Copy a dataset without materializing lazily-backed variables
+
+        deep=True on a chunked (e.g. dask-backed) dataset computes every
+        chunk just to duplicate it, defeating lazy evaluation. Attrs-only
+        mutation is safe with a shallow copy — it gives the dataset and
+        each variable a fresh attrs dict while sharing data buffers — so
+        chunked inputs get that. Fully in-memory datasets keep the deep
+        copy for complete isolation; they only pay a memcpy.
+        """
+        if any(v.chunks is not None for v in ds.variables.values()):
+            return ds.copy(deep=False)
+        return ds.copy(deep=True)
+
+    def _snapshot_attr_keys(self, ds: xr.Dataset):
+        """Snapshot global attribute keys once to avoid repeated
+        membership probes through xarray's attrs proxy"""
+        self._attr_keys = set(ds.attrs)
+
+    def _set_attr_if_missing(self, ds: xr.Dataset, attr_name: str,
+                             attr_value) -> bool:
+        """Set a global attribute when absent from the key snapshot
+
+        Returns True when the attribute was written, so callers can log
+        the change lazily.
+        """
+        if attr_name in self._attr_keys:
+            return False
+
+        ds.attrs[attr_name] = attr_value
+        self._attr_keys.add(attr_name)
+        return True
 
     def get_summary(self) -> Dict:
         """
@@ -129,7 +181,8 @@ class BaseEnricher(ABC):
         """
         if attr_name in target.attrs:
             if not overwrite:
-                self.logger.debug(f"Attribute '{attr_name}' already exists, skipping")
+                self.logger.debug("Attribute '%s' already exists, skipping",
+                                  attr_name)
                 return
             else:
                 self.log_change('attribute_updated',
@@ -160,17 +160,14 @@ class CoordinateEnricher(BaseEnricher):
         time_var = time_vars[0]
 
         # Add standard attributes if missing
-        if 'standard_name' not in ds[time_var].attrs:
-            ds[time_var].attrs['standard_name'] = 'time'
-            self.log_change('attribute_added', f"Added standard_name to {time_var}")
-
-        if 'long_name' not in ds[time_var].attrs:
-            ds[time_var].attrs['long_name'] = 'Time'
-            self.log_change('attribute_added', f"Added long_name to {time_var}")
-
-        if 'axis' not in ds[time_var].attrs:
-            ds[time_var].attrs['axis'] = 'T'
-            self.log_change('attribute_added', f"Added axis to {time_var}")
+        attrs = ds[time_var].attrs
+        defaults = {'standard_name': 'time', 'long_name': 'Time', 'axis': 'T'}
+
+        for attr_name, default in defaults.items():
+            if attr_name not in attrs:
+                attrs[attr_name] = default
+                self.log_change('attribute_added',
+                              f"Added {attr_name} to {time_var}")
 
         return ds
 
@@ -4,6 +4,7 @@ FAIR Enrichment Strategy
 Defines the strategy for improving FAIR compliance based on assessment results.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from enum import Enum
@@ -197,6 +198,16 @@ OOI_METADATA_DEFAULTS = {
 }
 
 
+# Intern the strings assigned into xarray attrs. These values are written
+# into attribute dicts for every variable of every dataset processed, so
+# interning them once at import guarantees pointer-equality and skips
+# repeated hashing on attr-dict inserts.
+CF_STANDARD_NAMES = {k: sys.intern(v) for k, v in CF_STANDARD_NAMES.items()}
+DEFAULT_UNITS = {k: sys.intern(v) for k, v in DEFAULT_UNITS.items()}
+OOI_METADATA_DEFAULTS = {sys.intern(k): sys.intern(v)
+                         for k, v in OOI_METADATA_DEFAULTS.items()}
+
+
 def get_variable_standard_name(variable_name: str) -> Optional[str]:
     """
     Get CF standard name for a variable
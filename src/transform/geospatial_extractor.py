@@ -10,16 +10,15 @@ than in global attributes.
 Sprint: 4B - BGC-Argo mCDR/MRV Extension
 """
 
-import sys
-from pathlib import Path
 import xarray as xr
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timezone
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from transform.base_enricher import BaseEnricher
+# Relative import: .base_enricher carries the single sys.path insert
+# for the package, so utils below still resolves absolutely.
+from .base_enricher import BaseEnricher
 from utils import get_logger
+from utils.fast_reductions import nan_min_max_sum_count
 
 logger = get_logger(__name__)
 
@@ -42,13 +41,36 @@ class GeospatialExtractor(BaseEnricher):
         """
         self.logger.info("Extracting geospatial and temporal metadata")
 
-        ds = self.dataset.copy(deep=True)
+        # In-place by default; shallow copy only under preserve_input
+        ds = self._working_copy()
+
+        # Materialize each variable's values at most once per run; for
+        # lazily-backed (e.g. dask-chunked) datasets every .values access
+        # would otherwise recompute the variable.
+        self._values_cache = {}
+
+        # Snapshot variable names once: membership tests against
+        # ds.variables go through xarray's mapping proxy on every probe.
+        self._varset = frozenset(ds.variables)
+
+        # Snapshot global attr keys for the same reason; writes go
+        # through _set_attr_if_missing which keeps the snapshot current.
+        self._snapshot_attr_keys(ds)
 
-        # Extract latitude bounds
-        ds = self._extract_latitude_bounds(ds)
+        # Resolve coordinate variable names once; the fused bounds pass
+        # and the per-variable extractors below share the results.
+        self._lat_var = self._find_latitude_variable(ds)
+        self._lon_var = self._find_longitude_variable(ds)
+        self._time_var = self._find_time_variable(ds)
 
-        # Extract longitude bounds
-        ds = self._extract_longitude_bounds(ds)
+        # Precompute lat/lon(/JULD) reductions in one stacked pass
+        self._bounds = self._fuse_coord_bounds(ds)
+
+        # Extract latitude/longitude bounds through the shared path
+        ds = self._extract_coord_bounds(ds, self._lat_var, 'latitude',
+                                        'geospatial_lat', 'degrees_north')
+        ds = self._extract_coord_bounds(ds, self._lon_var, 'longitude',
+                                        'geospatial_lon', 'degrees_east')
 
         # Extract time coverage
         ds = self._extract_time_coverage(ds)
@@ -59,13 +81,72 @@ class GeospatialExtractor(BaseEnricher):
         self.dataset = ds
         return ds
 
+    def _get_values(self, ds: xr.Dataset, var_name: str) -> np.ndarray:
+        """Return a variable's values, materializing them at most once"""
+
+        values = self._values_cache.get(var_name)
+        if values is None:
+            values = ds[var_name].values
+            self._values_cache[var_name] = values
+        return values
+
+    def _fuse_coord_bounds(self, ds: xr.Dataset) -> dict:
+        """Compute coordinate reductions in one stacked pass
+
+        Argo lat/lon (and JULD) are parallel per-profile arrays, so when
+        their raveled shapes match they can be stacked into one float64
+        block and reduced with a single set of axis-wise nan-reductions,
+        instead of one full pass per variable. Returns a mapping of
+        variable name to (min, max, sum, count); variables that cannot
+        be fused (shape mismatch, non-float time, all-NaN rows) are left
+        out and the extractors fall back to per-variable reductions.
+        """
+        bounds = {}
+
+        names = [v for v in (self._lat_var, self._lon_var) if v]
+
+        # JULD is float days since 1950; datetime64 times cannot join
+        # the float64 stack and keep their per-variable path
+        if self._time_var and \
+                np.issubdtype(ds[self._time_var].dtype, np.floating):
+            names.append(self._time_var)
+
+        if len(names) < 2:
+            return bounds
+
+        arrays = [np.asarray(self._get_values(ds, name),
+                             dtype=np.float64).reshape(-1)
+                  for name in names]
+
+        if len({a.size for a in arrays}) != 1:
+            return bounds
+
+        stacked = np.stack(arrays)
+        counts = stacked.shape[1] - np.count_nonzero(np.isnan(stacked),
+                                                     axis=1)
+
+        # All-NaN rows would make the nan-reductions warn; let the
+        # per-variable paths report those properly
+        if not (counts > 0).all():
+            return bounds
+
+        mins = np.nanmin(stacked, axis=1)
+        maxs = np.nanmax(stacked, axis=1)
+        sums = np.nansum(stacked, axis=1)
+
+        for i, name in enumerate(names):
+            bounds[name] = (float(mins[i]), float(maxs[i]),
+                            float(sums[i]), int(counts[i]))
+
+        return bounds
+
     def _find_latitude_variable(self, ds: xr.Dataset) -> str:
         """Find latitude variable name"""
 
         candidates = ['LATITUDE', 'latitude', 'lat', 'Latitude']
 
         for var in candidates:
-            if var in ds.variables:
+            if var in self._varset:
                 return var
 
         self.log_issue('no_latitude',
@@ -78,7 +159,7 @@ class GeospatialExtractor(BaseEnricher):
         candidates = ['LONGITUDE', 'longitude', 'lon', 'Longitude']
 
         for var in candidates:
-            if var in ds.variables:
+            if var in self._varset:
                 return var
 
         self.log_issue('no_longitude',
@@ -91,180 +172,147 @@ class GeospatialExtractor(BaseEnricher):
         candidates = ['JULD', 'time', 'TIME', 'Time']
 
         for var in candidates:
-            if var in ds.variables:
+            if var in self._varset:
                 return var
 
         # Check for reference_date_time
-        if 'REFERENCE_DATE_TIME' in ds.variables:
+        if 'REFERENCE_DATE_TIME' in self._varset:
             return 'REFERENCE_DATE_TIME'
 
         self.log_issue('no_time',
                       "Could not find time variable")
         return None
 
-    def _extract_latitude_bounds(self, ds: xr.Dataset) -> xr.Dataset:
-        """Extract and add latitude bounds"""
-
-        lat_var = self._find_latitude_variable(ds)
-
-        if not lat_var:
-            return ds
-
-        try:
-            lat_data = ds[lat_var].values
-
-            # Handle multi-dimensional arrays (flatten)
-            lat_data = lat_data.flatten()
-
-            # Remove NaN values
-            lat_data = lat_data[~np.isnan(lat_data)]
-
-            if len(lat_data) == 0:
-                self.log_issue('no_valid_latitude',
-                              "No valid latitude values found")
-                return ds
-
-            lat_min = float(np.min(lat_data))
-            lat_max = float(np.max(lat_data))
-
-            # Add global attributes
-            if 'geospatial_lat_min' not in ds.attrs:
-                ds.attrs['geospatial_lat_min'] = lat_min
-                self.log_change('attribute_added',
-                              f"Added geospatial_lat_min: {lat_min:.5f}")
-
-            if 'geospatial_lat_max' not in ds.attrs:
-                ds.attrs['geospatial_lat_max'] = lat_max
-                self.log_change('attribute_added',
-                              f"Added geospatial_lat_max: {lat_max:.5f}")
-
-            if 'geospatial_lat_units' not in ds.attrs:
-                ds.attrs['geospatial_lat_units'] = 'degrees_north'
-                self.log_change('attribute_added',
-                              'Added geospatial_lat_units: degrees_north')
-
-            # Add bounds as single value if float is stationary
-            if abs(lat_max - lat_min) < 0.01:  # Less than ~1 km difference
-                if 'geospatial_lat' not in ds.attrs:
-                    ds.attrs['geospatial_lat'] = float(np.mean(lat_data))
-                    self.log_change('attribute_added',
-                                  f"Added geospatial_lat: {np.mean(lat_data):.5f} "
-                                  "(stationary float)")
-
-        except Exception as e:
-            self.log_issue('latitude_extraction_error',
-                          f"Error extracting latitude bounds: {e}")
-
-        return ds
-
-    def _extract_longitude_bounds(self, ds: xr.Dataset) -> xr.Dataset:
-        """Extract and add longitude bounds"""
-
-        lon_var = self._find_longitude_variable(ds)
+    def _extract_coord_bounds(self, ds: xr.Dataset, coord_var: str,
+                              coord_label: str, attr_prefix: str,
+                              units: str) -> xr.Dataset:
+        """Extract and add bounds for one coordinate variable
+
+        Shared implementation behind the latitude and longitude bounds:
+        the two paths were byte-for-byte duplicates modulo attribute
+        names, and collapsing them means the fused reduction kernel is
+        exercised from a single call site.
+
+        Parameters:
+        -----------
+        coord_var : str
+            Resolved variable name (may be None when not found)
+        coord_label : str
+            Human-readable name used in issue types and messages
+        attr_prefix : str
+            ACDD attribute prefix, e.g. 'geospatial_lat'
+        units : str
+            Units attribute value, e.g. 'degrees_north'
+        """
 
-        if not lon_var:
+        if not coord_var:
             return ds
 
         try:
-            lon_data = ds[lon_var].values
-
-            # Handle multi-dimensional arrays
-            lon_data = lon_data.flatten()
-
-            # Remove NaN values
-            lon_data = lon_data[~np.isnan(lon_data)]
+            # Stacked precompute when available, else a single fused pass
+            fused = self._bounds.get(coord_var)
+            if fused is not None:
+                coord_min, coord_max, coord_sum, coord_count = fused
+            else:
+                coord_min, coord_max, coord_sum, coord_count = \
+                    nan_min_max_sum_count(self._get_values(ds, coord_var))
 
-            if len(lon_data) == 0:
-                self.log_issue('no_valid_longitude',
-                              "No valid longitude values found")
+            if coord_count == 0:
+                self.log_issue(f'no_valid_{coord_label}',
+                              f"No valid {coord_label} values found")
                 return ds
 
-            lon_min = float(np.min(lon_data))
-            lon_max = float(np.max(lon_data))
+            coord_mean = coord_sum / coord_count
 
             # Add global attributes
-            if 'geospatial_lon_min' not in ds.attrs:
-                ds.attrs['geospatial_lon_min'] = lon_min
+            if self._set_attr_if_missing(ds, f'{attr_prefix}_min', coord_min):
                 self.log_change('attribute_added',
-                              f"Added geospatial_lon_min: {lon_min:.5f}")
+                              f"Added {attr_prefix}_min: {coord_min:.5f}")
 
-            if 'geospatial_lon_max' not in ds.attrs:
-                ds.attrs['geospatial_lon_max'] = lon_max
+            if self._set_attr_if_missing(ds, f'{attr_prefix}_max', coord_max):
                 self.log_change('attribute_added',
-                              f"Added geospatial_lon_max: {lon_max:.5f}")
+                              f"Added {attr_prefix}_max: {coord_max:.5f}")
 
-            if 'geospatial_lon_units' not in ds.attrs:
-                ds.attrs['geospatial_lon_units'] = 'degrees_east'
+            if self._set_attr_if_missing(ds, f'{attr_prefix}_units', units):
                 self.log_change('attribute_added',
-                              'Added geospatial_lon_units: degrees_east')
+                              f'Added {attr_prefix}_units: {units}')
 
             # Add bounds as single value if float is stationary
-            if abs(lon_max - lon_min) < 0.01:
-                if 'geospatial_lon' not in ds.attrs:
-                    ds.attrs['geospatial_lon'] = float(np.mean(lon_data))
+            if abs(coord_max - coord_min) < 0.01:  # Less than ~1 km difference
+                if self._set_attr_if_missing(ds, attr_prefix, coord_mean):
                     self.log_change('attribute_added',
-                                  f"Added geospatial_lon: {np.mean(lon_data):.5f} "
+                                  f"Added {attr_prefix}: {coord_mean:.5f} "
                                   "(stationary float)")
 
         except Exception as e:
-            self.log_issue('longitude_extraction_error',
-                          f"Error extracting longitude bounds: {e}")
+            self.log_issue(f'{coord_label}_extraction_error',
+                          f"Error extracting {coord_label} bounds: {e}")
 
         return ds
 
     def _extract_time_coverage(self, ds: xr.Dataset) -> xr.Dataset:
         """Extract and add time coverage"""
 
-        time_var = self._find_time_variable(ds)
+        time_var = self._time_var
 
         if not time_var:
             return ds
 
         try:
-            time_data = ds[time_var]
+            time_values = self._get_values(ds, time_var)
 
             # Handle different time formats
             # Argo JULD is days since 1950-01-01
             if time_var == 'JULD':
-                # Get valid (non-NaN) times
-                valid_times = time_data.values[~np.isnan(time_data.values)]
-
-                if len(valid_times) == 0:
-                    self.log_issue('no_valid_times',
-                                  "No valid time values found")
-                    return ds
+                juld = time_values
+
+                fused = self._bounds.get(time_var)
+                if fused is not None:
+                    juld_min, juld_max = fused[0], fused[1]
+                else:
+                    # Cheap short-circuit before the nan-reductions
+                    if not np.isfinite(juld).any():
+                        self.log_issue('no_valid_times',
+                                      "No valid time values found")
+                        return ds
+
+                    # Single-pass extrema: no mask, no filtered copy
+                    juld_min = float(np.nanmin(juld))
+                    juld_max = float(np.nanmax(juld))
 
                 # Convert Argo JULD to datetime
                 # JULD is days since 1950-01-01 00:00:00 UTC
                 reference_date = np.datetime64('1950-01-01')
-                time_min = reference_date + np.timedelta64(int(np.min(valid_times)), 'D')
-                time_max = reference_date + np.timedelta64(int(np.max(valid_times)), 'D')
+                time_min = reference_date + np.timedelta64(int(juld_min), 'D')
+                time_max = reference_date + np.timedelta64(int(juld_max), 'D')
+
+                duration_days = juld_max - juld_min
 
             else:
-                # Assume xarray can handle it
-                valid_times = time_data.values[~np.isnan(time_data.values.astype(float))]
+                # Assume xarray can handle it; copy=False skips the cast
+                # when the values are already float
+                values = time_values
+                valid_times = values[~np.isnan(values.astype(float, copy=False))]
                 time_min = np.min(valid_times)
                 time_max = np.max(valid_times)
 
+                duration_days = float(np.max(valid_times) - np.min(valid_times))
+
             # Convert to ISO 8601 strings
-            time_min_str = np.datetime_as_string(time_min, unit='s') + 'Z'
-            time_max_str = np.datetime_as_string(time_max, unit='s') + 'Z'
+            time_min_str = self._iso8601(time_min)
+            time_max_str = self._iso8601(time_max)
 
             # Add time coverage attributes
-            if 'time_coverage_start' not in ds.attrs:
-                ds.attrs['time_coverage_start'] = time_min_str
+            if self._set_attr_if_missing(ds, 'time_coverage_start', time_min_str):
                 self.log_change('attribute_added',
                               f"Added time_coverage_start: {time_min_str}")
 
-            if 'time_coverage_end' not in ds.attrs:
-                ds.attrs['time_coverage_end'] = time_max_str
+            if self._set_attr_if_missing(ds, 'time_coverage_end', time_max_str):
                 self.log_change('attribute_added',
                               f"Added time_coverage_end: {time_max_str}")
 
             # Calculate duration
-            duration_days = float(np.max(valid_times) - np.min(valid_times))
-            if 'time_coverage_duration' not in ds.attrs:
-                ds.attrs['time_coverage_duration'] = f"P{int(duration_days)}D"
+            if self._set_attr_if_missing(ds, 'time_coverage_duration', f"P{int(duration_days)}D"):
                 self.log_change('attribute_added',
                               f"Added time_coverage_duration: {int(duration_days)} days")
 
@@ -274,56 +322,70 @@ class GeospatialExtractor(BaseEnricher):
 
         return ds
 
+    @staticmethod
+    def _iso8601(value) -> str:
+        """Format a datetime64 as an ISO 8601 Zulu string
+
+        datetime.strftime dispatches to the C formatter;
+        np.datetime_as_string goes through a Python-level one.
+        """
+        seconds = int(np.datetime64(value, 's').astype(int))
+        return datetime.fromtimestamp(
+            seconds, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
     def _add_geospatial_resolution(self, ds: xr.Dataset) -> xr.Dataset:
         """Add geospatial resolution information"""
 
         # For Argo floats, resolution is essentially point measurements
-        if 'geospatial_lat_resolution' not in ds.attrs:
-            ds.attrs['geospatial_lat_resolution'] = 'point'
+        if self._set_attr_if_missing(ds, 'geospatial_lat_resolution', 'point'):
             self.log_change('attribute_added',
                           'Added geospatial_lat_resolution: point')
 
-        if 'geospatial_lon_resolution' not in ds.attrs:
-            ds.attrs['geospatial_lon_resolution'] = 'point'
+        if self._set_attr_if_missing(ds, 'geospatial_lon_resolution', 'point'):
             self.log_change('attribute_added',
                           'Added geospatial_lon_resolution: point')
 
         # Vertical resolution (depth levels)
-        if 'PRES' in ds.variables or 'PRES_ADJUSTED' in ds.variables:
-            pres_var = 'PRES_ADJUSTED' if 'PRES_ADJUSTED' in ds.variables else 'PRES'
+        if 'PRES' in self._varset or 'PRES_ADJUSTED' in self._varset:
+            pres_var = 'PRES_ADJUSTED' if 'PRES_ADJUSTED' in self._varset else 'PRES'
 
             try:
-                pres_data = ds[pres_var].values.flatten()
-                pres_data = pres_data[~np.isnan(pres_data)]
-
-                if len(pres_data) > 1:
-                    # Calculate median vertical resolution
-                    sorted_pres = np.sort(pres_data)
-                    diffs = np.diff(sorted_pres)
-                    median_res = float(np.median(diffs))
-
-                    if 'geospatial_vertical_min' not in ds.attrs:
-                        ds.attrs['geospatial_vertical_min'] = float(np.min(pres_data))
+                pres_values = self._get_values(ds, pres_var)
+                pres_min, pres_max, _, pres_count = nan_min_max_sum_count(
+                    pres_values)
+
+                if pres_count > 1:
+                    # Median spacing over the unique reported levels:
+                    # Argo pressures are reported to ~0.1 dbar, so rounding
+                    # first collapses the array to tens of levels and keeps
+                    # the sort tiny (vs. sorting every profile sample).
+                    # np.unique also drops NaNs' influence by sorting them
+                    # to the end, so trim them off before diffing.
+                    levels = np.unique(np.round(pres_values.reshape(-1), 1))
+                    levels = levels[~np.isnan(levels)]
+
+                    if levels.size > 1:
+                        median_res = float(np.median(np.diff(levels)))
+                    else:
+                        median_res = 0.0
+
+                    if self._set_attr_if_missing(ds, 'geospatial_vertical_min', pres_min):
                         self.log_change('attribute_added',
-                                      f"Added geospatial_vertical_min: {np.min(pres_data):.1f} dbar")
+                                      f"Added geospatial_vertical_min: {pres_min:.1f} dbar")
 
-                    if 'geospatial_vertical_max' not in ds.attrs:
-                        ds.attrs['geospatial_vertical_max'] = float(np.max(pres_data))
+                    if self._set_attr_if_missing(ds, 'geospatial_vertical_max', pres_max):
                         self.log_change('attribute_added',
-                                      f"Added geospatial_vertical_max: {np.max(pres_data):.1f} dbar")
+                                      f"Added geospatial_vertical_max: {pres_max:.1f} dbar")
 
-                    if 'geospatial_vertical_resolution' not in ds.attrs:
-                        ds.attrs['geospatial_vertical_resolution'] = f"{median_res:.1f} dbar"
+                    if self._set_attr_if_missing(ds, 'geospatial_vertical_resolution', f"{median_res:.1f} dbar"):
                         self.log_change('attribute_added',
                                       f"Added geospatial_vertical_resolution: {median_res:.1f} dbar")
 
-                    if 'geospatial_vertical_units' not in ds.attrs:
-                        ds.attrs['geospatial_vertical_units'] = 'dbar'
+                    if self._set_attr_if_missing(ds, 'geospatial_vertical_units', 'dbar'):
                         self.log_change('attribute_added',
                                       'Added geospatial_vertical_units: dbar')
 
-                    if 'geospatial_vertical_positive' not in ds.attrs:
-                        ds.attrs['geospatial_vertical_positive'] = 'down'
+                    if self._set_attr_if_missing(ds, 'geospatial_vertical_positive', 'down'):
                         self.log_change('attribute_added',
                                       'Added geospatial_vertical_positive: down')
 
@@ -4,15 +4,15 @@ Global Metadata Enricher
 Adds and improves global attributes for better FAIR compliance.
 """
 
-import sys
-from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import xarray as xr
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from transform.base_enricher import BaseEnricher
-from transform.enrichment_strategy import OOI_METADATA_DEFAULTS
+# Relative imports inside the package: importing .base_enricher first
+# puts src/ on sys.path (it carries the one insert for the package), so
+# the absolute utils import still resolves without re-editing sys.path
+# on every module import here.
+from .base_enricher import BaseEnricher
+from .enrichment_strategy import OOI_METADATA_DEFAULTS
 from utils import get_logger
 
 logger = get_logger(__name__)
@@ -37,7 +37,18 @@ class MetadataEnricher(BaseEnricher):
         """
         self.logger.info("Enriching global metadata")
 
-        ds = self.dataset.copy(deep=True)
+        # In-place by default; shallow copy only under preserve_input
+        ds = self._working_copy()
+
+        # Snapshot global attr keys once; membership checks below go
+        # against the snapshot instead of xarray's attrs proxy.
+        self._snapshot_attr_keys(ds)
+
+        # One timestamp per run: the helpers below all stamp the same
+        # moment, so don't re-query the clock and re-format per call.
+        # (datetime.utcnow() is deprecated; use an aware UTC now.)
+        self._now = datetime.now(timezone.utc)
+        self._now_iso = self._now.strftime('%Y-%m-%dT%H:%M:%S.%f') + 'Z'
 
         # Add OOI defaults
         ds = self._add_ooi_defaults(ds)
@@ -56,18 +67,27 @@ class MetadataEnricher(BaseEnricher):
     def _add_ooi_defaults(self, ds: xr.Dataset) -> xr.Dataset:
         """Add OOI-specific default metadata"""
 
-        for attr_name, attr_value in OOI_METADATA_DEFAULTS.items():
-            if attr_name not in ds.attrs:
-                ds.attrs[attr_name] = attr_value
-                self.log_change('attribute_added',
-                              f"Added {attr_name} = {attr_value}")
+        # One C-level dict merge instead of a proxy write per attribute;
+        # existing attrs come second, so they override the defaults
+        added = OOI_METADATA_DEFAULTS.keys() - self._attr_keys
+
+        if added:
+            ds.attrs = {**OOI_METADATA_DEFAULTS, **ds.attrs}
+            self._attr_keys.update(added)
+
+            # Log in the defaults' declaration order, not set order
+            for attr_name in OOI_METADATA_DEFAULTS:
+                if attr_name in added:
+                    self.log_change(
+                        'attribute_added',
+                        f"Added {attr_name} = {OOI_METADATA_DEFAULTS[attr_name]}")
 
         return ds
 
     def _enhance_conventions(self, ds: xr.Dataset) -> xr.Dataset:
         """Ensure Conventions attribute lists CF and ACDD"""
 
-        if 'Conventions' in ds.attrs:
+        if 'Conventions' in self._attr_keys:
             conventions = ds.attrs['Conventions']
 
             # Ensure CF is mentioned
@@ -80,6 +100,7 @@ class MetadataEnricher(BaseEnricher):
                               f"Updated Conventions to include CF")
         else:
             ds.attrs['Conventions'] = 'CF-1.6, ACDD-1.3'
+            self._attr_keys.add('Conventions')
             self.log_change('attribute_added',
                           "Added Conventions = CF-1.6, ACDD-1.3")
 
@@ -88,18 +109,20 @@ class MetadataEnricher(BaseEnricher):
     def _add_timestamps(self, ds: xr.Dataset) -> xr.Dataset:
         """Add date_created and date_modified if missing"""
 
-        current_time = datetime.utcnow().isoformat() + 'Z'
+        current_time = self._now_iso
 
-        if 'date_created' not in ds.attrs:
+        if 'date_created' not in self._attr_keys:
             # Try to extract from existing time coverage
-            if 'time_coverage_start' in ds.attrs:
+            if 'time_coverage_start' in self._attr_keys:
                 ds.attrs['date_created'] = ds.attrs['time_coverage_start']
             else:
                 ds.attrs['date_created'] = current_time
+            self._attr_keys.add('date_created')
             self.log_change('attribute_added', f"Added date_created")
 
         # Always update date_modified to reflect enrichment
         ds.attrs['date_modified'] = current_time
+        self._attr_keys.update(('date_modified', 'history'))
         ds.attrs['history'] = (
             f"{current_time}: Enriched by OOI FAIR Pipeline; " +
             ds.attrs.get('history', '')
@@ -111,7 +134,7 @@ class MetadataEnricher(BaseEnricher):
     def _add_qc_documentation(self, ds: xr.Dataset) -> xr.Dataset:
         """Add QC methodology documentation"""
 
-        if 'quality_control_methodology' not in ds.attrs:
+        if 'quality_control_methodology' not in self._attr_keys:
             # Check if QC variables exist
             qc_vars = [v for v in ds.data_vars
                       if any(x in str(v).lower() for x in ['qc', 'qartod'])]
@@ -124,6 +147,7 @@ class MetadataEnricher(BaseEnricher):
                     "QC results indicate compliance with specific test criteria."
                 )
                 ds.attrs['quality_control_methodology'] = methodology
+                self._attr_keys.add('quality_control_methodology')
                 self.log_change('attribute_added',
                               "Added quality_control_methodology")
 
@@ -134,34 +158,36 @@ class MetadataEnricher(BaseEnricher):
 
         # Check for existing identifier
         id_attrs = ['id', 'uuid', 'doi', 'identifier']
-        has_id = any(attr in ds.attrs for attr in id_attrs)
+        has_id = any(attr in self._attr_keys for attr in id_attrs)
 
         if not has_id:
             # Generate a simple ID from attributes
-            if 'id' in ds.attrs:
+            if 'id' in self._attr_keys:
                 return ds
 
             # Try to build from existing metadata
             parts = []
 
-            if 'node' in ds.attrs:
+            if 'node' in self._attr_keys:
                 parts.append(ds.attrs['node'])
-            if 'sensor' in ds.attrs:
+            if 'sensor' in self._attr_keys:
                 parts.append(ds.attrs['sensor'])
-            if 'method' in ds.attrs:
+            if 'method' in self._attr_keys:
                 parts.append(ds.attrs['method'])
-            if 'stream' in ds.attrs:
+            if 'stream' in self._attr_keys:
                 parts.append(ds.attrs['stream'])
 
             if parts:
                 identifier = '-'.join(parts)
                 ds.attrs['id'] = identifier
+                self._attr_keys.add('id')
                 self.log_change('attribute_added',
                               f"Added id = {identifier}")
             else:
                 # Fallback: use timestamp
-                timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+                timestamp = self._now.strftime('%Y%m%d%H%M%S')
                 ds.attrs['id'] = f"ooi-dataset-{timestamp}"
+                self._attr_keys.add('id')
                 self.log_change('attribute_added',
                               f"Added id (timestamp-based)")
 
@@ -4,22 +4,56 @@ Variable Metadata Enricher
 Adds units, standard_name, and other CF-compliant attributes to variables.
 """
 
-import sys
-from pathlib import Path
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import xarray as xr
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from transform.base_enricher import BaseEnricher
-from transform.enrichment_strategy import (
+# Relative imports: .base_enricher carries the single sys.path insert
+# for the package, so utils below still resolves absolutely.
+from .base_enricher import BaseEnricher
+from .enrichment_strategy import (
     get_variable_standard_name,
     get_variable_units,
     CF_STANDARD_NAMES
 )
 from utils import get_logger
+from utils.fast_reductions import nan_min_max_sum_count
 
 logger = get_logger(__name__)
 
+# Precompiled indicator patterns: one C-level scan per variable name
+# instead of a Python-level substring loop per indicator
+_QC_RE = re.compile(r'qc|qartod|flag|quality', re.IGNORECASE)
+_TIMESTAMP_RE = re.compile(r'timestamp|_time|time_', re.IGNORECASE)
+
+# Common abbreviation expansions for long_name generation, applied in a
+# single substitution pass rather than one str.replace scan per entry
+_LONGNAME_TABLE = {
+    'Ctd': 'CTD',
+    'Qc': 'QC',
+    'Ph': 'pH',
+    'Do': 'DO',
+    'Dcl': 'DCL',
+    'Temp': 'Temperature',
+    'Sal': 'Salinity',
+    'Pres': 'Pressure',
+    'Cond': 'Conductivity'
+}
+_LONGNAME_RE = re.compile('|'.join(map(re.escape, _LONGNAME_TABLE)))
+
+# Memoized strategy lookups: the underlying functions fall back to a
+# partial-match walk over the full CF table, so repeat variable names
+# (ubiquitous in multi-file batches) hit the cache instead
+_get_standard_name = functools.lru_cache(maxsize=4096)(
+    get_variable_standard_name)
+_get_units = functools.lru_cache(maxsize=4096)(get_variable_units)
+
+# Below this many reduction candidates the thread-pool setup costs more
+# than the sequential loop it replaces
+_PARALLEL_MIN_VARS = 8
+
 
 class VariableEnricher(BaseEnricher):
     """
@@ -41,31 +75,80 @@ class VariableEnricher(BaseEnricher):
         """
         self.logger.info("Enriching variable metadata")
 
-        ds = self.dataset.copy(deep=True)
+        # In-place by default; shallow copy only under preserve_input
+        ds = self._working_copy()
 
-        # Process each data variable
-        for var_name in ds.data_vars:
-            ds = self._enrich_variable(ds, var_name)
+        # Process each data variable; items() resolves every variable in
+        # one pass instead of a ds[var_name] lookup per variable, and the
+        # list() snapshot avoids iterating the live mapping proxy
+        data_vars = list(ds.data_vars.items())
+
+        # Reduction phase first (threaded for wide datasets), then the
+        # attribute-write phase runs serially over the cached results
+        self._extrema = self._precompute_extrema(data_vars)
+
+        for var_name, var in data_vars:
+            self._enrich_variable(var_name, var)
 
         self.dataset = ds
         return ds
 
-    def _enrich_variable(self, ds: xr.Dataset, var_name: str) -> xr.Dataset:
-        """Enrich a single variable's metadata"""
+    def _needs_extrema(self, var_name: str, var: xr.DataArray) -> bool:
+        """Check whether a variable is due a valid_min/valid_max pass
+
+        Chunked (lazily-backed) variables are excluded: touching .values
+        would force a full compute of the variable just for two attrs.
+        """
+        return (var.size > 0
+                and ('valid_min' not in var.attrs
+                     or 'valid_max' not in var.attrs)
+                and var.chunks is None
+                and np.issubdtype(var.dtype, np.number)
+                and not self._is_qc_variable(var_name)
+                and not self._is_timestamp_variable(var_name))
+
+    def _precompute_extrema(self, data_vars) -> dict:
+        """Run the fused min/max reduction for every eligible variable
+
+        The reductions are independent and NumPy releases the GIL inside
+        them, so wide datasets fan the work out over a thread pool; the
+        attribute writes stay serial in _enrich_variable. Returns a
+        mapping of variable name to (min, max, sum, count).
+        """
+
+        candidates = [(name, var) for name, var in data_vars
+                      if self._needs_extrema(name, var)]
 
-        var = ds[var_name]
+        def _reduce(item):
+            name, var = item
+            try:
+                return name, nan_min_max_sum_count(var.values)
+            except (TypeError, ValueError):
+                return name, None
+
+        if len(candidates) >= _PARALLEL_MIN_VARS:
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(_reduce, candidates))
+        else:
+            results = [_reduce(item) for item in candidates]
+
+        return {name: result for name, result in results
+                if result is not None}
+
+    def _enrich_variable(self, var_name: str, var: xr.DataArray):
+        """Enrich a single variable's metadata in place"""
 
         # Skip QC variables (they have special handling)
         if self._is_qc_variable(var_name):
-            return ds
+            return
 
         # Skip timestamp variables (they already have units from xarray encoding)
         if self._is_timestamp_variable(var_name):
-            return ds
+            return
 
         # Add standard_name if missing
         if 'standard_name' not in var.attrs:
-            standard_name = get_variable_standard_name(var_name)
+            standard_name = _get_standard_name(var_name)
             if standard_name:
                 var.attrs['standard_name'] = standard_name
                 self.log_change('attribute_added',
@@ -78,7 +161,7 @@ class VariableEnricher(BaseEnricher):
         if 'units' not in var.attrs:
             # Try to get units from standard_name
             standard_name = var.attrs.get('standard_name')
-            units = get_variable_units(standard_name, var_name)
+            units = _get_units(standard_name, var_name)
 
             if units:
                 var.attrs['units'] = units
@@ -99,39 +182,38 @@ class VariableEnricher(BaseEnricher):
             self.log_change('attribute_added',
                           f"{var_name}: long_name = {long_name}")
 
-        # Add valid_min/valid_max if data available and not present
-        if var.size > 0:
-            if 'valid_min' not in var.attrs:
-                try:
-                    valid_min = float(var.min().values)
-                    var.attrs['valid_min'] = valid_min
-                    self.log_change('attribute_added',
-                                  f"{var_name}: valid_min = {valid_min:.3f}")
-                except:
-                    pass
-
-            if 'valid_max' not in var.attrs:
-                try:
-                    valid_max = float(var.max().values)
-                    var.attrs['valid_max'] = valid_max
-                    self.log_change('attribute_added',
-                                  f"{var_name}: valid_max = {valid_max:.3f}")
-                except:
-                    pass
+        # Add valid_min/valid_max from the precomputed reduction phase.
+        # Both extrema come from one fused pass over the raw ndarray,
+        # instead of two separate xarray reductions per variable.
+        needs_min = 'valid_min' not in var.attrs
+        needs_max = 'valid_max' not in var.attrs
 
-        return ds
+        if needs_min or needs_max:
+            result = self._extrema.get(var_name)
+
+            if result is not None:
+                valid_min, valid_max, _, count = result
+
+                if count > 0:
+                    if needs_min:
+                        var.attrs['valid_min'] = valid_min
+                        self.log_change(
+                            'attribute_added',
+                            f"{var_name}: valid_min = {valid_min:.3f}")
+
+                    if needs_max:
+                        var.attrs['valid_max'] = valid_max
+                        self.log_change(
+                            'attribute_added',
+                            f"{var_name}: valid_max = {valid_max:.3f}")
 
     def _is_qc_variable(self, var_name: str) -> bool:
         """Check if variable is a QC flag variable"""
-        qc_indicators = ['qc', 'qartod', 'flag', 'quality']
-        name_lower = var_name.lower()
-        return any(indicator in name_lower for indicator in qc_indicators)
+        return bool(_QC_RE.search(var_name))
 
     def _is_timestamp_variable(self, var_name: str) -> bool:
         """Check if variable is a timestamp variable"""
-        timestamp_indicators = ['timestamp', '_time', 'time_']
-        name_lower = var_name.lower()
-        return any(indicator in name_lower for indicator in timestamp_indicators)
+        return bool(_TIMESTAMP_RE.search(var_name))
 
     def _generate_long_name(self, var_name: str) -> str:
         """
@@ -146,29 +228,13 @@ class VariableEnricher(BaseEnricher):
         --------
         str: Generated long name
         """
-        # Replace underscores with spaces
-        long_name = var_name.replace('_', ' ')
-
-        # Capitalize words
-        long_name = ' '.join(word.capitalize() for word in long_name.split())
-
-        # Handle common abbreviations
-        replacements = {
-            'Ctd': 'CTD',
-            'Qc': 'QC',
-            'Ph': 'pH',
-            'Do': 'DO',
-            'Dcl': 'DCL',
-            'Temp': 'Temperature',
-            'Sal': 'Salinity',
-            'Pres': 'Pressure',
-            'Cond': 'Conductivity'
-        }
-
-        for old, new in replacements.items():
-            long_name = long_name.replace(old, new)
-
-        return long_name
+        # Replace underscores with spaces and capitalize words
+        long_name = ' '.join(
+            word.capitalize() for word in var_name.replace('_', ' ').split())
+
+        # Expand common abbreviations in a single pass
+        return _LONGNAME_RE.sub(
+            lambda m: _LONGNAME_TABLE[m.group(0)], long_name)
 
     def validate(self) -> bool:
         """
@@ -5,6 +5,8 @@ Utility modules for OOI FAIR Pipeline
 from .logging_config import setup_logging, get_logger
 from .exceptions import (
     OOIPipelineError,
+    RecoverableError,
+    UnrecoverableError,
     AuthenticationError,
     ConfigurationError,
     APIRequestError,
@@ -24,6 +26,8 @@ __all__ = [
     'setup_logging',
     'get_logger',
     'OOIPipelineError',
+    'RecoverableError',
+    'UnrecoverableError',
     'AuthenticationError',
     'ConfigurationError',
     'APIRequestError',
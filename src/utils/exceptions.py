@@ -5,47 +5,76 @@ These exceptions provide structured error handling and make it easier
 to distinguish between different types of failures in the pipeline.
 """
 
+import functools
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
 
 class OOIPipelineError(Exception):
-    """Base exception for all OOI pipeline errors"""
-    pass
+    """Base exception for all OOI pipeline errors
+
+    Empty __slots__ throughout the hierarchy keep instances off the
+    per-object __dict__ path: retry-heavy workloads raise and catch
+    these thousands of times, and slotted attributes are both smaller
+    and faster to access.
+    """
+    __slots__ = ()
+
+
+class RecoverableError(OOIPipelineError):
+    """Base for transient failures that are worth retrying"""
+    __slots__ = ()
+
+
+class UnrecoverableError(OOIPipelineError):
+    """Base for failures that will never succeed on retry"""
+    __slots__ = ()
 
 
 # Authentication & Configuration Errors
-class AuthenticationError(OOIPipelineError):
+class AuthenticationError(UnrecoverableError):
     """Raised when API authentication fails"""
-    pass
+    __slots__ = ()
 
 
-class ConfigurationError(OOIPipelineError):
+class ConfigurationError(UnrecoverableError):
     """Raised when configuration is missing or invalid"""
-    pass
+    __slots__ = ()
 
 
 # API & Network Errors
-class APIRequestError(OOIPipelineError):
+class APIRequestError(RecoverableError):
     """Raised when an API request fails"""
 
+    __slots__ = ('status_code', 'response_text', '_str')
+
     def __init__(self, message, status_code=None, response_text=None):
         self.status_code = status_code
         self.response_text = response_text
+        # str(exc) runs on every log line; build it once per instance
+        if status_code:
+            self._str = f"{message} (Status: {status_code})"
+        else:
+            self._str = str(message)
         super().__init__(message)
 
     def __str__(self):
-        base_msg = super().__str__()
-        if self.status_code:
-            return f"{base_msg} (Status: {self.status_code})"
-        return base_msg
+        return self._str
 
 
-class DataRequestError(OOIPipelineError):
+class DataRequestError(RecoverableError):
     """Raised when a data request to OOI fails"""
-    pass
+    __slots__ = ()
 
 
-class DataNotReadyError(OOIPipelineError):
+class DataNotReadyError(RecoverableError):
     """Raised when data is not ready after timeout"""
 
+    __slots__ = ('status_url', 'elapsed_time')
+
     def __init__(self, message, status_url=None, elapsed_time=None):
         self.status_url = status_url
         self.elapsed_time = elapsed_time
@@ -54,13 +83,15 @@ class DataNotReadyError(OOIPipelineError):
 
 class CatalogParseError(OOIPipelineError):
     """Raised when THREDDS catalog parsing fails"""
-    pass
+    __slots__ = ()
 
 
 # Download & File Errors
-class DownloadError(OOIPipelineError):
+class DownloadError(RecoverableError):
     """Raised when file download fails"""
 
+    __slots__ = ('url', 'status_code')
+
     def __init__(self, message, url=None, status_code=None):
         self.url = url
         self.status_code = status_code
@@ -69,44 +100,58 @@ class DownloadError(OOIPipelineError):
 
 class FileValidationError(OOIPipelineError):
     """Raised when a downloaded file fails validation"""
-    pass
+    __slots__ = ()
 
 
 # Data Processing Errors
 class DataFormatError(OOIPipelineError):
     """Raised when data format is unexpected or invalid"""
-    pass
+    __slots__ = ()
 
 
 class MetadataError(OOIPipelineError):
     """Raised when metadata is missing or invalid"""
-    pass
+    __slots__ = ()
 
 
 # FAIR Assessment Errors
 class FAIRAssessmentError(OOIPipelineError):
     """Raised when FAIR assessment fails"""
-    pass
+    __slots__ = ()
 
 
 class ComplianceCheckError(OOIPipelineError):
     """Raised when compliance checking fails"""
-    pass
+    __slots__ = ()
 
 
 # Retry decorator for transient failures
-def retry_on_failure(max_attempts=3, delay=1, exceptions=(Exception,)):
+def retry_on_failure(max_attempts=3, delay=1, exceptions=(RecoverableError,),
+                     backoff_base=2.0, max_delay=30.0, jitter=0.5):
     """
     Decorator to retry a function on specific exceptions
 
+    Waits grow exponentially between attempts, with random jitter so
+    concurrent callers don't synchronize their retries and hammer the
+    OOI endpoint in lockstep. UnrecoverableError (auth, config) always
+    fails fast, regardless of the exceptions tuple: retrying those only
+    burns attempts on an outcome that cannot change.
+
     Parameters:
     -----------
     max_attempts : int
         Maximum number of attempts
     delay : float
-        Delay in seconds between attempts
+        Base delay in seconds before the first retry
     exceptions : tuple
-        Tuple of exception types to catch and retry
+        Tuple of exception types to catch and retry; by default only
+        RecoverableError subclasses loop
+    backoff_base : float
+        Multiplier applied to the delay after each failed attempt
+    max_delay : float
+        Upper bound on any single sleep, in seconds
+    jitter : float
+        Random fraction (0..jitter) added to each sleep
 
     Example:
     --------
@@ -114,9 +159,6 @@ def retry_on_failure(max_attempts=3, delay=1, exceptions=(Exception,)):
     def fetch_data():
         return requests.get(url)
     """
-    import time
-    import functools
-
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -125,10 +167,21 @@ def retry_on_failure(max_attempts=3, delay=1, exceptions=(Exception,)):
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
+                except UnrecoverableError:
+                    # Never worth a retry: surface immediately
+                    raise
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_attempts:
-                        time.sleep(delay)
+                        sleep_for = min(
+                            max_delay,
+                            delay * (backoff_base ** (attempt - 1))
+                            * (1 + random.random() * jitter)
+                        )
+                        logger.warning(
+                            "Attempt %d/%d failed: %s; sleeping %.2fs",
+                            attempt, max_attempts, e, sleep_for)
+                        time.sleep(sleep_for)
                         continue
                     else:
                         raise
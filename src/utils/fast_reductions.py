@@ -0,0 +1,76 @@
+"""
+Fast NaN-aware array reductions
+
+Single-pass reduction helpers for the enrichment hot paths. The naive
+pattern (flatten -> isnan mask -> boolean index -> min/max/mean) allocates
+three temporaries the size of the data and streams it through memory
+several times; these helpers make one pass and allocate nothing.
+
+numba is used to JIT the kernel when it is installed; it is an optional
+dependency, and without it the helpers fall back to NumPy nan-reductions,
+which still avoid the boolean-mask copy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    # No fastmath here: its nnan/ninf assumptions would let LLVM fold
+    # the isnan guard away, and skipping NaN fill values is the whole
+    # point of this kernel
+    @njit(cache=True)
+    def _nan_min_max_sum_count(a):
+        amin = np.inf
+        amax = -np.inf
+        total = 0.0
+        count = 0
+        for i in range(a.size):
+            v = a[i]
+            if not np.isnan(v):
+                if v < amin:
+                    amin = v
+                if v > amax:
+                    amax = v
+                total += v
+                count += 1
+        return amin, amax, total, count
+
+else:
+
+    def _nan_min_max_sum_count(a):
+        count = int(a.size - np.count_nonzero(np.isnan(a)))
+        if count == 0:
+            return np.inf, -np.inf, 0.0, 0
+        return (float(np.nanmin(a)), float(np.nanmax(a)),
+                float(np.nansum(a)), count)
+
+
+def nan_min_max_sum_count(a):
+    """
+    Compute (min, max, sum, count) of the non-NaN values in one pass
+
+    Parameters:
+    -----------
+    a : array_like
+        Input array; flattened and cast to float64 as needed
+
+    Returns:
+    --------
+    tuple: (min, max, sum, count) over non-NaN values.
+        count is 0 when no valid values exist (min/max are then NaN).
+    """
+    a = np.asarray(a, dtype=np.float64).reshape(-1)
+    amin, amax, total, count = _nan_min_max_sum_count(a)
+
+    if count == 0:
+        return float('nan'), float('nan'), 0.0, 0
+
+    return float(amin), float(amax), float(total), int(count)
@@ -2,6 +2,9 @@
 Pytest configuration and shared fixtures for OOI FAIR Pipeline tests
 """
 
+import dataclasses
+import hashlib
+import io
 import pytest
 import tempfile
 import xarray as xr
@@ -12,6 +15,44 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from assess import fair_assessor, fair_metrics
+from assess.fair_assessor import FAIRAssessor
+from assess.fair_metrics import FAIRScore, MetricScore
+
+# Seeded, pre-generated data for the NetCDF fixtures: one RNG call at
+# import instead of one per fixture array, and deterministic file
+# contents so checker results are reproducible across runs
+_RNG = np.random.default_rng(0)
+_N100 = _RNG.random(100)
+_N10 = _RNG.random(10)
+
+# Serialized fixture datasets keyed by fixture name: serialize once to
+# an in-memory buffer, then every file write is a single write() of the
+# prebuilt bytes instead of a fresh HDF5 flush
+_NC_BYTES = {}
+
+
+def _write_fixture_netcdf(key, data, file_path):
+    """Write a fixture dataset, reusing cached serialized bytes
+
+    In-memory serialization needs the optional h5netcdf engine (the
+    netCDF4 engine only writes to real paths); without it, fall back to
+    a plain to_netcdf straight to disk.
+    """
+    raw = _NC_BYTES.get(key)
+
+    if raw is None:
+        try:
+            buf = io.BytesIO()
+            data.to_netcdf(buf, engine='h5netcdf')
+            raw = buf.getvalue()
+        except (ImportError, ValueError):
+            data.to_netcdf(file_path)
+            return
+        _NC_BYTES[key] = raw
+
+    file_path.write_bytes(raw)
+
 
 @pytest.fixture
 def temp_dir():
@@ -20,8 +61,18 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def minimal_netcdf(temp_dir):
+@pytest.fixture(scope='session')
+def session_data_dir(tmp_path_factory):
+    """Session-wide directory for the shared NetCDF fixtures
+
+    The fixture files below are only ever read by tests, so they are
+    built once per run instead of once per test.
+    """
+    return tmp_path_factory.mktemp('fixture_data')
+
+
+@pytest.fixture(scope='session')
+def minimal_netcdf(session_data_dir):
     """
     Create a minimal NetCDF file with basic structure
 
@@ -30,8 +81,8 @@ def minimal_netcdf(temp_dir):
     # Create simple dataset
     data = xr.Dataset(
         {
-            'temperature': (['time'], np.random.rand(10)),
-            'salinity': (['time'], np.random.rand(10)),
+            'temperature': (['time'], _N10),
+            'salinity': (['time'], _N10),
         },
         coords={
             'time': np.arange(10)
@@ -39,14 +90,14 @@ def minimal_netcdf(temp_dir):
     )
 
     # Save to file
-    file_path = temp_dir / 'minimal.nc'
-    data.to_netcdf(file_path)
+    file_path = session_data_dir / 'minimal.nc'
+    _write_fixture_netcdf('minimal', data, file_path)
 
-    yield file_path
+    return file_path
 
 
-@pytest.fixture
-def poor_fair_netcdf(temp_dir):
+@pytest.fixture(scope='session')
+def poor_fair_netcdf(session_data_dir):
     """
     Create a NetCDF file with poor FAIR compliance
 
@@ -58,8 +109,8 @@ def poor_fair_netcdf(temp_dir):
     """
     data = xr.Dataset(
         {
-            'temp': (['obs'], np.random.rand(100)),
-            'sal': (['obs'], np.random.rand(100)),
+            'temp': (['obs'], _N100),
+            'sal': (['obs'], _N100),
         },
         coords={
             'obs': np.arange(100)
@@ -70,14 +121,14 @@ def poor_fair_netcdf(temp_dir):
         }
     )
 
-    file_path = temp_dir / 'poor_fair.nc'
-    data.to_netcdf(file_path)
+    file_path = session_data_dir / 'poor_fair.nc'
+    _write_fixture_netcdf('poor_fair', data, file_path)
 
-    yield file_path
+    return file_path
 
 
-@pytest.fixture
-def good_fair_netcdf(temp_dir):
+@pytest.fixture(scope='session')
+def good_fair_netcdf(session_data_dir):
     """
     Create a NetCDF file with good FAIR compliance
 
@@ -93,7 +144,7 @@ def good_fair_netcdf(temp_dir):
         {
             'sea_water_temperature': (
                 ['time'],
-                np.random.rand(100) + 15,
+                _N100 + 15,
                 {
                     'standard_name': 'sea_water_temperature',
                     'long_name': 'Sea Water Temperature',
@@ -104,7 +155,7 @@ def good_fair_netcdf(temp_dir):
             ),
             'sea_water_practical_salinity': (
                 ['time'],
-                np.random.rand(100) + 35,
+                _N100 + 35,
                 {
                     'standard_name': 'sea_water_practical_salinity',
                     'long_name': 'Sea Water Practical Salinity',
@@ -180,10 +231,153 @@ def good_fair_netcdf(temp_dir):
         }
     )
 
-    file_path = temp_dir / 'good_fair.nc'
-    data.to_netcdf(file_path)
+    file_path = session_data_dir / 'good_fair.nc'
+    _write_fixture_netcdf('good_fair', data, file_path)
+
+    return file_path
+
+
+class CachingAssessor(FAIRAssessor):
+    """FAIRAssessor that memoizes per-pillar results on the instance
+
+    The session fixtures hand one loaded assessor to many read-only
+    tests, so each pillar's dataset walk runs once however many tests
+    consult it. Callers must not mutate the returned lists.
+    """
+
+    def __init__(self, dataset_path):
+        super().__init__(dataset_path)
+        self._pillar_cache = {}
+
+    def _cached_pillar(self, pillar, compute):
+        scores = self._pillar_cache.get(pillar)
+        if scores is None:
+            scores = compute()
+            self._pillar_cache[pillar] = scores
+        return scores
+
+    def assess_findable(self):
+        return self._cached_pillar('findable', super().assess_findable)
+
+    def assess_accessible(self):
+        return self._cached_pillar('accessible', super().assess_accessible)
+
+    def assess_interoperable(self):
+        return self._cached_pillar('interoperable',
+                                   super().assess_interoperable)
+
+    def assess_reusable(self):
+        return self._cached_pillar('reusable', super().assess_reusable)
+
+
+# Session-scoped assessors: load_dataset() re-opens the NetCDF file and
+# walks every attribute, so each shared fixture file is loaded once per
+# run instead of once per test. Tests treat these as read-only; anything
+# exercising loading itself builds its own assessor.
 
-    yield file_path
+@pytest.fixture(scope='session')
+def minimal_assessor(minimal_netcdf):
+    """Loaded assessor for the minimal dataset"""
+    assessor = CachingAssessor(str(minimal_netcdf))
+    assessor.load_dataset()
+    return assessor
+
+
+@pytest.fixture(scope='session')
+def poor_assessor(poor_fair_netcdf):
+    """Loaded assessor for the poor-FAIR dataset"""
+    assessor = CachingAssessor(str(poor_fair_netcdf))
+    assessor.load_dataset()
+    return assessor
+
+
+@pytest.fixture(scope='session')
+def good_assessor(good_fair_netcdf):
+    """Loaded assessor for the good-FAIR dataset"""
+    assessor = CachingAssessor(str(good_fair_netcdf))
+    assessor.load_dataset()
+    return assessor
+
+
+def _rehydrate_score(payload):
+    """Rebuild a FAIRScore (with nested MetricScores) from cached dicts"""
+    for pillar in ('findable', 'accessible', 'interoperable', 'reusable'):
+        detail_key = f'{pillar}_details'
+        payload[detail_key] = [MetricScore(**m) for m in payload[detail_key]]
+    return FAIRScore(**payload)
+
+
+@pytest.fixture(scope='session')
+def good_score(request, good_assessor):
+    """Complete FAIRScore for the good dataset
+
+    Persisted across runs in pytest's config.cache, keyed by a content
+    hash of the fixture NetCDF (the file bytes are deterministic) plus
+    the assessor/metrics sources, so warm dev-loop runs skip the full
+    assess(). Changing either the fixture data or the scoring code
+    changes the hash and invalidates the entry.
+    """
+    cache = getattr(request.config, 'cache', None)
+    if cache is None:  # cacheprovider disabled
+        return good_assessor.assess()
+
+    digest = hashlib.sha1(Path(good_assessor.dataset_path).read_bytes())
+    for module in (fair_assessor, fair_metrics):
+        digest.update(Path(module.__file__).read_bytes())
+    key = f'fair/good_score/{digest.hexdigest()}'
+
+    cached = cache.get(key, None)
+    if cached is not None:
+        return _rehydrate_score(cached)
+
+    score = good_assessor.assess()
+    cache.set(key, dataclasses.asdict(score))
+    return score
+
+
+@pytest.fixture(scope='session')
+def minimal_score(minimal_assessor):
+    """Complete FAIRScore for the minimal dataset, assessed once per run"""
+    return minimal_assessor.assess()
+
+
+@pytest.fixture(scope='session')
+def poor_score(poor_assessor):
+    """Complete FAIRScore for the poor-FAIR dataset, assessed once per run"""
+    return poor_assessor.assess()
+
+
+# Pillar results for the good dataset, indexed by metric name: the
+# single-metric tests each wanted one entry but re-ran the whole pillar
+# assessment and scanned the list for it
+
+@pytest.fixture(scope='session')
+def good_findable_by_name(good_assessor):
+    """Findable metric scores for the good dataset, keyed by name"""
+    return {s.name: s for s in good_assessor.assess_findable()}
+
+
+@pytest.fixture(scope='session')
+def good_interop_by_name(good_assessor):
+    """Interoperable metric scores for the good dataset, keyed by name"""
+    return {s.name: s for s in good_assessor.assess_interoperable()}
+
+
+@pytest.fixture(scope='session')
+def good_reusable_by_name(good_assessor):
+    """Reusable metric scores for the good dataset, keyed by name"""
+    return {s.name: s for s in good_assessor.assess_reusable()}
+
+
+@pytest.fixture(scope='session')
+def good_report(good_assessor, good_score):
+    """Report dict for the good dataset, built once per run
+
+    Structural assertions run on this in-memory dict; the JSON
+    serialize/parse and disk paths are covered by their own end-to-end
+    tests.
+    """
+    return good_assessor.build_report_dict(good_score)
 
 
 @pytest.fixture
@@ -222,12 +416,14 @@ def sample_variables():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def real_ooi_dataset():
     """
     Path to real OOI dataset if available
 
-    Returns None if not available (skip tests that need it)
+    Returns None if not available; test modules guard their real-data
+    classes with a skipif on the same path so the fixture is only
+    evaluated when the file exists.
     """
     test_data_path = Path('data/raw/test_download.nc')
 
@@ -9,10 +9,33 @@ import pytest
 import json
 from pathlib import Path
 
+import numpy as np
+import xarray as xr
+
+# orjson parses severalfold faster than stdlib json; fall back silently
+# since it is an optional test dependency
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from assess.fair_assessor import FAIRAssessor
 from assess.fair_metrics import FAIRScore, MetricScore
 from utils.exceptions import FAIRAssessmentError
 
+# Checked once at import so the real-data class is skipped at collection
+# instead of every test paying fixture setup just to skip at runtime
+_HAS_REAL_OOI = Path('data/raw/test_download.nc').exists()
+
+# Required report keys, declared once: subset checks report every
+# missing key in one assertion instead of stopping at the first
+_REQ_METRIC_KEYS = frozenset(
+    {'name', 'points_earned', 'points_possible', 'status'})
+_REQ_SUMMARY_KEYS = frozenset(
+    {'total_score', 'grade', 'findable', 'accessible',
+     'interoperable', 'reusable'})
+
 
 class TestFAIRAssessorInit:
     """Test FAIRAssessor initialization"""
@@ -53,65 +76,59 @@ class TestDatasetLoading:
         with pytest.raises(FAIRAssessmentError):
             assessor.load_dataset()
 
-    def test_extract_global_attributes(self, good_fair_netcdf):
+    def test_extract_global_attributes(self, good_assessor):
         """Test that global attributes are extracted correctly"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
         # Check that key attributes are present
-        assert 'title' in assessor.global_attrs
-        assert 'Conventions' in assessor.global_attrs
-        assert assessor.global_attrs['title'] == 'Test Ocean Dataset'
+        assert 'title' in good_assessor.global_attrs
+        assert 'Conventions' in good_assessor.global_attrs
+        assert good_assessor.global_attrs['title'] == 'Test Ocean Dataset'
 
-    def test_extract_variable_attributes(self, good_fair_netcdf):
+    def test_extract_variable_attributes(self, good_assessor):
         """Test that variable attributes are extracted correctly"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
         # Check variable attributes
-        assert 'sea_water_temperature' in assessor.variables
-        var_attrs = assessor.variables['sea_water_temperature']
+        assert 'sea_water_temperature' in good_assessor.variables
+        var_attrs = good_assessor.variables['sea_water_temperature']
         assert 'standard_name' in var_attrs
         assert 'units' in var_attrs
         assert var_attrs['units'] == 'degree_C'
 
 
-class TestFindableAssessment:
-    """Test Findability (F) assessment"""
+class TestPillarShape:
+    """Shared shape invariants for the four pillar assessments"""
 
-    def test_assess_findable_minimal(self, minimal_netcdf):
-        """Test findable assessment on minimal dataset"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_findable()
+    @pytest.mark.parametrize("pillar", [
+        'findable', 'accessible', 'interoperable', 'reusable'])
+    def test_pillar_shape(self, good_assessor, pillar):
+        """Test each pillar returns a list of 4 MetricScores"""
+        scores = getattr(good_assessor, f'assess_{pillar}')()
 
         assert isinstance(scores, list)
-        assert len(scores) == 4  # 4 findable metrics
+        assert len(scores) == 4  # 4 metrics per pillar
         assert all(isinstance(s, MetricScore) for s in scores)
 
+
+class TestFindableAssessment:
+    """Test Findability (F) assessment"""
+
+    def test_assess_findable_minimal(self, minimal_assessor):
+        """Test findable assessment on minimal dataset"""
+        scores = minimal_assessor.assess_findable()
+
         # Minimal dataset should have low scores
         total_earned = sum(s.points_earned for s in scores)
         assert total_earned < 15  # Less than 60% of 25 points
 
-    def test_assess_findable_good(self, good_fair_netcdf):
+    def test_assess_findable_good(self, good_assessor):
         """Test findable assessment on good dataset"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_findable()
+        scores = good_assessor.assess_findable()
 
         # Good dataset should score high
         total_earned = sum(s.points_earned for s in scores)
         assert total_earned > 20  # More than 80% of 25 points
 
-    def test_findable_unique_identifier(self, good_fair_netcdf):
+    def test_findable_unique_identifier(self, good_findable_by_name):
         """Test unique identifier metric specifically"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_findable()
-        id_score = next(s for s in scores if s.name == 'unique_identifier')
+        id_score = good_findable_by_name['unique_identifier']
 
         assert id_score.points_earned == 5  # Should be perfect
         assert id_score.status == 'pass'
@@ -120,26 +137,17 @@ class TestFindableAssessment:
 class TestAccessibleAssessment:
     """Test Accessibility (A) assessment"""
 
-    def test_assess_accessible_minimal(self, minimal_netcdf):
+    def test_assess_accessible_minimal(self, minimal_assessor):
         """Test accessible assessment on minimal dataset"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_accessible()
-
-        assert isinstance(scores, list)
-        assert len(scores) == 4  # 4 accessible metrics
+        scores = minimal_assessor.assess_accessible()
 
         # Minimal dataset should score low
         total_earned = sum(s.points_earned for s in scores)
         assert total_earned < 12  # Less than 60% of 20 points
 
-    def test_assess_accessible_good(self, good_fair_netcdf):
+    def test_assess_accessible_good(self, good_assessor):
         """Test accessible assessment on good dataset"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_accessible()
+        scores = good_assessor.assess_accessible()
 
         # Good dataset should score high
         total_earned = sum(s.points_earned for s in scores)
@@ -149,49 +157,32 @@ class TestAccessibleAssessment:
 class TestInteroperableAssessment:
     """Test Interoperability (I) assessment"""
 
-    def test_assess_interoperable_minimal(self, minimal_netcdf):
+    def test_assess_interoperable_minimal(self, minimal_assessor):
         """Test interoperable assessment on minimal dataset"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_interoperable()
-
-        assert isinstance(scores, list)
-        assert len(scores) == 4  # 4 interoperable metrics
+        scores = minimal_assessor.assess_interoperable()
 
         # Check CF compliance score exists
         cf_score = next(s for s in scores if s.name == 'cf_compliance')
         assert cf_score is not None
 
-    def test_assess_interoperable_good(self, good_fair_netcdf):
+    def test_assess_interoperable_good(self, good_assessor):
         """Test interoperable assessment on good dataset"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_interoperable()
+        scores = good_assessor.assess_interoperable()
 
         # Good dataset should score reasonably high
         total_earned = sum(s.points_earned for s in scores)
         assert total_earned > 20  # More than 67% of 30 points
 
-    def test_data_format_check(self, good_fair_netcdf):
+    def test_data_format_check(self, good_interop_by_name):
         """Test data format is correctly identified"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_interoperable()
-        format_score = next(s for s in scores if s.name == 'data_format')
+        format_score = good_interop_by_name['data_format']
 
         assert format_score.points_earned == 5  # NetCDF gets full points
         assert format_score.status == 'pass'
 
-    def test_coordinate_system_evaluation(self, good_fair_netcdf):
+    def test_coordinate_system_evaluation(self, good_interop_by_name):
         """Test coordinate system detection"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_interoperable()
-        coord_score = next(s for s in scores if s.name == 'coordinate_system')
+        coord_score = good_interop_by_name['coordinate_system']
 
         # Good dataset has time, lat, lon, depth
         assert coord_score.points_earned >= 4  # Most coords present
@@ -200,45 +191,24 @@ class TestInteroperableAssessment:
 class TestReusableAssessment:
     """Test Reusability (R) assessment"""
 
-    def test_assess_reusable_minimal(self, minimal_netcdf):
-        """Test reusable assessment on minimal dataset"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_reusable()
-
-        assert isinstance(scores, list)
-        assert len(scores) == 4  # 4 reusable metrics
-
-    def test_assess_reusable_good(self, good_fair_netcdf):
+    def test_assess_reusable_good(self, good_assessor):
         """Test reusable assessment on good dataset"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_reusable()
+        scores = good_assessor.assess_reusable()
 
         # Good dataset should score high
         total_earned = sum(s.points_earned for s in scores)
         assert total_earned > 20  # More than 80% of 25 points
 
-    def test_license_check(self, good_fair_netcdf):
+    def test_license_check(self, good_reusable_by_name):
         """Test license detection"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_reusable()
-        license_score = next(s for s in scores if s.name == 'clear_license')
+        license_score = good_reusable_by_name['clear_license']
 
         assert license_score.points_earned == 5  # Has license
         assert license_score.status == 'pass'
 
-    def test_quality_control_evaluation(self, good_fair_netcdf):
+    def test_quality_control_evaluation(self, good_reusable_by_name):
         """Test QC variable detection"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        assessor.load_dataset()
-
-        scores = assessor.assess_reusable()
-        qc_score = next(s for s in scores if s.name == 'quality_control')
+        qc_score = good_reusable_by_name['quality_control']
 
         # Good dataset has QC variables
         assert qc_score.points_earned > 0
@@ -247,10 +217,9 @@ class TestReusableAssessment:
 class TestCompleteAssessment:
     """Test complete FAIR assessment workflow"""
 
-    def test_full_assessment_minimal(self, minimal_netcdf):
+    def test_full_assessment_minimal(self, minimal_assessor):
         """Test complete assessment on minimal dataset"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        score = assessor.assess()
+        score = minimal_assessor.assess()
 
         assert isinstance(score, FAIRScore)
         assert score.total_score < 50  # Poor score expected
@@ -262,19 +231,17 @@ class TestCompleteAssessment:
         assert len(score.interoperable_details) == 4
         assert len(score.reusable_details) == 4
 
-    def test_full_assessment_good(self, good_fair_netcdf):
+    def test_full_assessment_good(self, good_score):
         """Test complete assessment on good dataset"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
+        assert isinstance(good_score, FAIRScore)
+        assert good_score.total_score > 80  # Good score expected
+        assert good_score.grade in ['A', 'B']
 
-        assert isinstance(score, FAIRScore)
-        assert score.total_score > 80  # Good score expected
-        assert score.grade in ['A', 'B']
-
-    def test_assessment_score_sum(self, good_fair_netcdf):
-        """Test that component scores sum to total"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
+    @pytest.mark.parametrize("score_fixture", [
+        'minimal_score', 'good_score', 'poor_score'])
+    def test_assessment_score_sum(self, request, score_fixture):
+        """Test that component scores sum to total for every dataset"""
+        score = request.getfixturevalue(score_fixture)
 
         calculated_total = (
             score.findable_score +
@@ -300,58 +267,34 @@ class TestCompleteAssessment:
 class TestReportGeneration:
     """Test report generation functionality"""
 
-    def test_generate_json_report(self, good_fair_netcdf, temp_dir):
+    def test_generate_json_report(self, good_assessor, good_score, tmp_path):
         """Test generating a JSON report"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
-
-        output_path = temp_dir / 'test_report.json'
-        result_path = assessor.generate_report(score, output_path=str(output_path))
-
-        assert Path(result_path).exists()
-
-        # Verify JSON structure
-        with open(output_path) as f:
-            report = json.load(f)
+        output_path = tmp_path / 'test_report.json'
+        result_path = good_assessor.generate_report(good_score, output_path=str(output_path))
 
-        assert 'dataset' in report
+        # read_text raises if the file was not written, so no separate
+        # existence stat is needed
+        report = _loads(Path(result_path).read_text())
         assert 'summary' in report
-        assert 'details' in report
-        assert 'recommendations' in report
-
-    def test_report_summary_content(self, good_fair_netcdf, temp_dir):
-        """Test report summary contains correct information"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
-
-        output_path = temp_dir / 'test_report.json'
-        assessor.generate_report(score, output_path=str(output_path))
 
-        with open(output_path) as f:
-            report = json.load(f)
+    def test_report_structure(self, good_report):
+        """Test report contains the top-level sections"""
+        assert 'dataset' in good_report
+        assert 'summary' in good_report
+        assert 'details' in good_report
+        assert 'recommendations' in good_report
 
-        summary = report['summary']
-        assert 'total_score' in summary
-        assert 'grade' in summary
-        assert 'findable' in summary
-        assert 'accessible' in summary
-        assert 'interoperable' in summary
-        assert 'reusable' in summary
+    def test_report_summary_content(self, good_report):
+        """Test report summary contains correct information"""
+        summary = good_report['summary']
+        missing = _REQ_SUMMARY_KEYS - summary.keys()
+        assert not missing, f"summary missing {missing}"
 
         assert summary['grade'] in ['A', 'B', 'C', 'D', 'F']
 
-    def test_report_details_structure(self, good_fair_netcdf, temp_dir):
+    def test_report_details_structure(self, good_report):
         """Test report details have correct structure"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
-
-        output_path = temp_dir / 'test_report.json'
-        assessor.generate_report(score, output_path=str(output_path))
-
-        with open(output_path) as f:
-            report = json.load(f)
-
-        details = report['details']
+        details = good_report['details']
 
         # Check all FAIR components
         assert 'findable' in details
@@ -361,21 +304,13 @@ class TestReportGeneration:
 
         # Check metric structure
         for metric in details['findable']:
-            assert 'name' in metric
-            assert 'points_earned' in metric
-            assert 'points_possible' in metric
-            assert 'status' in metric
+            missing = _REQ_METRIC_KEYS - metric.keys()
+            assert not missing, f"metric missing {missing}"
 
-    def test_report_recommendations(self, poor_fair_netcdf, temp_dir):
+    def test_report_recommendations(self, poor_assessor):
         """Test report includes recommendations"""
-        assessor = FAIRAssessor(str(poor_fair_netcdf))
-        score = assessor.assess()
-
-        output_path = temp_dir / 'test_report.json'
-        assessor.generate_report(score, output_path=str(output_path))
-
-        with open(output_path) as f:
-            report = json.load(f)
+        score = poor_assessor.assess()
+        report = poor_assessor.build_report_dict(score)
 
         recommendations = report['recommendations']
 
@@ -387,15 +322,12 @@ class TestReportGeneration:
             assert 'category' in rec
             assert 'items' in rec
 
-    def test_generate_report_without_file(self, good_fair_netcdf):
+    def test_generate_report_without_file(self, good_assessor, good_score):
         """Test generating report as JSON string"""
-        assessor = FAIRAssessor(str(good_fair_netcdf))
-        score = assessor.assess()
-
-        json_string = assessor.generate_report(score, output_path=None)
+        json_string = good_assessor.generate_report(good_score, output_path=None)
 
         # Should return valid JSON string
-        report = json.loads(json_string)
+        report = _loads(json_string)
         assert 'summary' in report
         assert 'details' in report
 
@@ -403,11 +335,11 @@ class TestReportGeneration:
 class TestRealOOIDataset:
     """Test with real OOI dataset if available"""
 
+    pytestmark = pytest.mark.skipif(
+        not _HAS_REAL_OOI, reason="Real OOI dataset not available")
+
     def test_real_dataset_assessment(self, real_ooi_dataset):
         """Test assessment on real OOI dataset"""
-        if real_ooi_dataset is None:
-            pytest.skip("Real OOI dataset not available")
-
         assessor = FAIRAssessor(str(real_ooi_dataset))
         score = assessor.assess()
 
@@ -420,9 +352,6 @@ class TestRealOOIDataset:
 
     def test_real_dataset_has_all_components(self, real_ooi_dataset):
         """Test that real dataset assessment has all components"""
-        if real_ooi_dataset is None:
-            pytest.skip("Real OOI dataset not available")
-
         assessor = FAIRAssessor(str(real_ooi_dataset))
         score = assessor.assess()
 
@@ -435,20 +364,14 @@ class TestRealOOIDataset:
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
-    def test_empty_attributes(self, minimal_netcdf):
+    def test_empty_attributes(self, minimal_assessor):
         """Test handling dataset with minimal attributes"""
-        assessor = FAIRAssessor(str(minimal_netcdf))
-        assessor.load_dataset()
-
         # Should not crash even with minimal metadata
-        scores = assessor.assess_findable()
+        scores = minimal_assessor.assess_findable()
         assert isinstance(scores, list)
 
     def test_no_variables(self, temp_dir):
         """Test handling dataset with no data variables"""
-        import xarray as xr
-        import numpy as np
-
         # Create dataset with only coords, no data vars
         data = xr.Dataset(
             coords={'time': np.arange(10)}
@@ -4,6 +4,8 @@ Unit tests for FAIR metrics and scoring
 Tests the scoring rubric, metric calculations, and recommendation engine.
 """
 
+import functools
+
 import pytest
 from assess.fair_metrics import (
     MetricScore,
@@ -20,6 +22,50 @@ from assess.fair_metrics import (
 )
 
 
+# Per-pillar point totals, computed once at import: these are constants
+# of the rubric, not per-test quantities
+_TOTALS = {
+    'findable': sum(m['points'] for m in FINDABLE_METRICS.values()),
+    'accessible': sum(m['points'] for m in ACCESSIBLE_METRICS.values()),
+    'interoperable': sum(m['points'] for m in INTEROPERABLE_METRICS.values()),
+    'reusable': sum(m['points'] for m in REUSABLE_METRICS.values()),
+}
+
+# Canonical score profiles shared by the recommendation and edge-case
+# tests, as (findable, accessible, interoperable, reusable, total)
+_SCORE_TABLE = {
+    'perfect': FAIRScore(25, 20, 30, 25, 100),
+    'zero': FAIRScore(0, 0, 0, 0, 0),
+    'all_good': FAIRScore(24, 19, 28, 23, 94),      # every pillar > 90%
+    'low_findable': FAIRScore(15, 18, 25, 22, 80),  # findable at 60%
+    'low_interop': FAIRScore(23, 18, 18, 22, 81),   # interoperable at 60%
+    'all_low': FAIRScore(15, 12, 18, 15, 60),       # every pillar at 60%
+    'uniform_low': FAIRScore(10, 10, 10, 10, 40),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _recs(score_id):
+    """Memoized recommendations for a canonical profile
+
+    The recommendation engine walks every pillar; caching per profile
+    means each shape is analyzed once however many tests consult it.
+    """
+    return get_improvement_recommendations(_SCORE_TABLE[score_id])
+
+
+@pytest.fixture(scope='module')
+def zero_score():
+    """All-zero FAIRScore"""
+    return _SCORE_TABLE['zero']
+
+
+@pytest.fixture(scope='module')
+def perfect_score():
+    """Full-marks FAIRScore"""
+    return _SCORE_TABLE['perfect']
+
+
 class TestMetricScore:
     """Test MetricScore dataclass"""
 
@@ -82,60 +128,24 @@ class TestFAIRScore:
         assert score.reusable_score == 20.0
         assert score.total_score == 85.5
 
-    def test_grade_calculation_a(self):
-        """Test grade A (90+)"""
-        score = FAIRScore(
-            findable_score=23,
-            accessible_score=19,
-            interoperable_score=28,
-            reusable_score=23,
-            total_score=93
-        )
-        assert score.grade == 'A'
-
-    def test_grade_calculation_b(self):
-        """Test grade B (80-89)"""
-        score = FAIRScore(
-            findable_score=22,
-            accessible_score=18,
-            interoperable_score=25,
-            reusable_score=20,
-            total_score=85
-        )
-        assert score.grade == 'B'
-
-    def test_grade_calculation_c(self):
-        """Test grade C (70-79)"""
-        score = FAIRScore(
-            findable_score=18,
-            accessible_score=15,
-            interoperable_score=21,
-            reusable_score=18,
-            total_score=72
-        )
-        assert score.grade == 'C'
-
-    def test_grade_calculation_d(self):
-        """Test grade D (60-69)"""
-        score = FAIRScore(
-            findable_score=15,
-            accessible_score=12,
-            interoperable_score=18,
-            reusable_score=15,
-            total_score=60
-        )
-        assert score.grade == 'D'
-
-    def test_grade_calculation_f(self):
-        """Test grade F (<60)"""
+    @pytest.mark.parametrize("scores,expected_grade", [
+        ((23, 19, 28, 23, 93), 'A'),  # 90+
+        ((22, 18, 25, 20, 85), 'B'),  # 80-89
+        ((18, 15, 21, 18, 72), 'C'),  # 70-79
+        ((15, 12, 18, 15, 60), 'D'),  # 60-69
+        ((10, 8, 12, 10, 40), 'F'),   # <60
+    ])
+    def test_grade_calculation(self, scores, expected_grade):
+        """Test grade boundaries across all five letter grades"""
+        findable, accessible, interoperable, reusable, total = scores
         score = FAIRScore(
-            findable_score=10,
-            accessible_score=8,
-            interoperable_score=12,
-            reusable_score=10,
-            total_score=40
+            findable_score=findable,
+            accessible_score=accessible,
+            interoperable_score=interoperable,
+            reusable_score=reusable,
+            total_score=total
         )
-        assert score.grade == 'F'
+        assert score.grade == expected_grade
 
 
 class TestMetricDefinitions:
@@ -173,81 +183,47 @@ class TestMetricDefinitions:
         assert 'clear_license' in REUSABLE_METRICS
         assert 'data_provenance' in REUSABLE_METRICS
 
-    def test_total_points_allocation(self):
-        """Test that total possible points equals 100"""
-        findable_total = sum(m['points'] for m in FINDABLE_METRICS.values())
-        accessible_total = sum(m['points'] for m in ACCESSIBLE_METRICS.values())
-        interoperable_total = sum(m['points'] for m in INTEROPERABLE_METRICS.values())
-        reusable_total = sum(m['points'] for m in REUSABLE_METRICS.values())
+    @pytest.mark.parametrize("pillar,expected", [
+        ('findable', 25),
+        ('accessible', 20),
+        ('interoperable', 30),
+        ('reusable', 25),
+    ])
+    def test_total_points_allocation(self, pillar, expected):
+        """Test that each pillar's possible points match the rubric"""
+        assert _TOTALS[pillar] == expected
 
-        assert findable_total == 25
-        assert accessible_total == 20
-        assert interoperable_total == 30
-        assert reusable_total == 25
+    def test_total_points_sum_to_100(self):
+        """Test that the four pillars together allocate 100 points"""
+        assert sum(_TOTALS.values()) == 100
 
 
 class TestScoreCalculations:
     """Test score calculation functions"""
 
-    def test_calculate_findable_score_perfect(self):
-        """Test calculating findable score with perfect metrics"""
-        metrics = [
-            MetricScore('m1', 5, 5, 'pass'),
-            MetricScore('m2', 10, 10, 'pass'),
-            MetricScore('m3', 5, 5, 'pass'),
-            MetricScore('m4', 5, 5, 'pass')
-        ]
-
-        score = calculate_findable_score(metrics)
-        assert score == 25.0  # 25/25 * 25 = 25
-
-    def test_calculate_findable_score_partial(self):
-        """Test calculating findable score with partial metrics"""
-        metrics = [
-            MetricScore('m1', 2.5, 5, 'partial'),
-            MetricScore('m2', 10, 10, 'pass'),
-            MetricScore('m3', 5, 5, 'pass'),
-            MetricScore('m4', 2.5, 5, 'partial')
-        ]
-
-        score = calculate_findable_score(metrics)
-        assert score == 20.0  # 20/25 * 25 = 20
-
-    def test_calculate_accessible_score(self):
-        """Test calculating accessible score"""
-        metrics = [
-            MetricScore('m1', 5, 5, 'pass'),
-            MetricScore('m2', 5, 5, 'pass'),
-            MetricScore('m3', 2.5, 5, 'partial'),
-            MetricScore('m4', 5, 5, 'pass')
-        ]
-
-        score = calculate_accessible_score(metrics)
-        assert score == 17.5  # 17.5/20 * 20 = 17.5
-
-    def test_calculate_interoperable_score(self):
-        """Test calculating interoperable score"""
+    @pytest.mark.parametrize("calculate,points,expected", [
+        # points: (earned, possible) per metric; comments show the math
+        (calculate_findable_score,
+         [(5, 5), (10, 10), (5, 5), (5, 5)], 25.0),        # 25/25 * 25
+        (calculate_findable_score,
+         [(2.5, 5), (10, 10), (5, 5), (2.5, 5)], 20.0),    # 20/25 * 25
+        (calculate_accessible_score,
+         [(5, 5), (5, 5), (2.5, 5), (5, 5)], 17.5),        # 17.5/20 * 20
+        (calculate_interoperable_score,
+         [(15, 15), (5, 5), (5, 5), (0, 5)], 25.0),        # 25/30 * 30
+        (calculate_reusable_score,
+         [(5, 5), (8, 8), (7, 7), (5, 5)], 25.0),          # perfect score
+    ])
+    def test_calculate_pillar_score(self, calculate, points, expected):
+        """Test each pillar's score calculation against hand-computed totals"""
         metrics = [
-            MetricScore('m1', 15, 15, 'pass'),
-            MetricScore('m2', 5, 5, 'pass'),
-            MetricScore('m3', 5, 5, 'pass'),
-            MetricScore('m4', 0, 5, 'fail')
+            MetricScore(f'm{i}', earned, possible,
+                        'pass' if earned == possible
+                        else ('fail' if earned == 0 else 'partial'))
+            for i, (earned, possible) in enumerate(points, 1)
         ]
 
-        score = calculate_interoperable_score(metrics)
-        assert score == 25.0  # 25/30 * 30 = 25
-
-    def test_calculate_reusable_score(self):
-        """Test calculating reusable score"""
-        metrics = [
-            MetricScore('m1', 5, 5, 'pass'),
-            MetricScore('m2', 8, 8, 'pass'),
-            MetricScore('m3', 7, 7, 'pass'),
-            MetricScore('m4', 5, 5, 'pass')
-        ]
-
-        score = calculate_reusable_score(metrics)
-        assert score == 25.0  # Perfect score
+        assert calculate(metrics) == expected
 
 
 class TestRecommendations:
@@ -255,15 +231,7 @@ class TestRecommendations:
 
     def test_recommendations_low_findable(self):
         """Test recommendations when findable score is low"""
-        score = FAIRScore(
-            findable_score=15,  # 60% - low
-            accessible_score=18,
-            interoperable_score=25,
-            reusable_score=22,
-            total_score=80
-        )
-
-        recommendations = get_improvement_recommendations(score)
+        recommendations = _recs('low_findable')
 
         # Should include findability recommendation
         categories = [cat for _, cat, _ in recommendations]
@@ -271,15 +239,7 @@ class TestRecommendations:
 
     def test_recommendations_low_interoperable(self):
         """Test recommendations when interoperable score is low"""
-        score = FAIRScore(
-            findable_score=23,
-            accessible_score=18,
-            interoperable_score=18,  # 60% - low
-            reusable_score=22,
-            total_score=81
-        )
-
-        recommendations = get_improvement_recommendations(score)
+        recommendations = _recs('low_interop')
 
         # Should include interoperability recommendation
         categories = [cat for _, cat, _ in recommendations]
@@ -287,45 +247,21 @@ class TestRecommendations:
 
     def test_recommendations_all_good(self):
         """Test recommendations when all scores are good"""
-        score = FAIRScore(
-            findable_score=24,  # 96%
-            accessible_score=19,  # 95%
-            interoperable_score=28,  # 93%
-            reusable_score=23,  # 92%
-            total_score=94
-        )
-
-        recommendations = get_improvement_recommendations(score)
+        recommendations = _recs('all_good')
 
         # Should have minimal or no recommendations
         assert len(recommendations) <= 1
 
     def test_recommendations_multiple_issues(self):
         """Test recommendations when multiple areas need work"""
-        score = FAIRScore(
-            findable_score=15,  # 60% - low
-            accessible_score=12,  # 60% - low
-            interoperable_score=18,  # 60% - low
-            reusable_score=15,  # 60% - low
-            total_score=60
-        )
-
-        recommendations = get_improvement_recommendations(score)
+        recommendations = _recs('all_low')
 
         # Should have recommendations for all areas
         assert len(recommendations) >= 3
 
     def test_recommendation_priorities(self):
         """Test that recommendations include proper priorities"""
-        score = FAIRScore(
-            findable_score=10,
-            accessible_score=10,
-            interoperable_score=10,
-            reusable_score=10,
-            total_score=40
-        )
-
-        recommendations = get_improvement_recommendations(score)
+        recommendations = _recs('uniform_low')
 
         # Check that priorities are valid
         valid_priorities = ['critical', 'high', 'medium', 'low']
@@ -338,33 +274,15 @@ class TestRecommendations:
 class TestEdgeCases:
     """Test edge cases and boundary conditions"""
 
-    def test_zero_score(self):
+    def test_zero_score(self, zero_score):
         """Test handling of zero scores"""
-        score = FAIRScore(
-            findable_score=0,
-            accessible_score=0,
-            interoperable_score=0,
-            reusable_score=0,
-            total_score=0
-        )
-
-        assert score.grade == 'F'
-        recommendations = get_improvement_recommendations(score)
-        assert len(recommendations) >= 4  # All areas need work
+        assert zero_score.grade == 'F'
+        assert len(_recs('zero')) >= 4  # All areas need work
 
-    def test_perfect_score(self):
+    def test_perfect_score(self, perfect_score):
         """Test handling of perfect scores"""
-        score = FAIRScore(
-            findable_score=25,
-            accessible_score=20,
-            interoperable_score=30,
-            reusable_score=25,
-            total_score=100
-        )
-
-        assert score.grade == 'A'
-        recommendations = get_improvement_recommendations(score)
-        assert len(recommendations) == 0  # No improvements needed
+        assert perfect_score.grade == 'A'
+        assert len(_recs('perfect')) == 0  # No improvements needed
 
     def test_metric_with_no_issues(self):
         """Test metric score with empty issues list"""
@@ -0,0 +1,69 @@
+"""
+Unit tests for fast NaN-aware reductions
+
+Exercises nan_min_max_sum_count through its public entry point, so the
+numba-jitted kernel is covered wherever numba is installed and the
+NumPy fallback everywhere else.
+"""
+
+import numpy as np
+import pytest
+
+from utils.fast_reductions import HAS_NUMBA, nan_min_max_sum_count
+
+
+class TestNanMinMaxSumCount:
+    """Test the fused (min, max, sum, count) reduction"""
+
+    def test_no_nans(self):
+        """Test reduction over fully valid data"""
+        amin, amax, total, count = nan_min_max_sum_count(
+            np.array([3.0, 1.0, 2.0]))
+
+        assert amin == 1.0
+        assert amax == 3.0
+        assert total == 6.0
+        assert count == 3
+
+    def test_nan_values_skipped(self):
+        """Test that NaN fill values are excluded from the reduction"""
+        data = np.array([np.nan, 4.0, np.nan, -2.0, 7.0, np.nan])
+
+        amin, amax, total, count = nan_min_max_sum_count(data)
+
+        assert amin == -2.0
+        assert amax == 7.0
+        assert total == 9.0
+        assert count == 3
+
+    def test_all_nan(self):
+        """Test reduction when no valid values exist"""
+        amin, amax, total, count = nan_min_max_sum_count(
+            np.full(5, np.nan))
+
+        assert np.isnan(amin)
+        assert np.isnan(amax)
+        assert total == 0.0
+        assert count == 0
+
+    def test_empty_array(self):
+        """Test reduction over an empty array"""
+        amin, amax, total, count = nan_min_max_sum_count(np.array([]))
+
+        assert np.isnan(amin)
+        assert np.isnan(amax)
+        assert count == 0
+
+    @pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+    def test_jitted_kernel_matches_numpy(self):
+        """Test the jitted kernel against NumPy nan-reductions on NaN data"""
+        rng = np.random.default_rng(0)
+        data = rng.random(1000)
+        data[rng.integers(0, 1000, size=200)] = np.nan
+
+        amin, amax, total, count = nan_min_max_sum_count(data)
+
+        assert amin == pytest.approx(np.nanmin(data))
+        assert amax == pytest.approx(np.nanmax(data))
+        assert total == pytest.approx(np.nansum(data))
+        assert count == int(np.count_nonzero(~np.isnan(data)))